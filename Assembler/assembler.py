@@ -1,5 +1,7 @@
+import os
 import sys
 import logging
+from array import array
 from pathlib import Path
 from tokenizer import AssemblerTokenizer
 from parser import AssemblerParser
@@ -8,11 +10,11 @@ from code_generator import AssemblerCodeGenerator
 from errors import InvalidSyntaxError
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Binary text of every byte value, used to format instruction words in bulk
+_BYTE_BITS = tuple(format(byte, "08b") for byte in range(256))
 
 
 class Assembler:
@@ -20,7 +22,7 @@ class Assembler:
         self.tokenizer = AssemblerTokenizer()
         self.validator = AssemblerValidator()
 
-    def assemble(self, code: str, filename: str = "unknown") -> list[str]:
+    def assemble(self, code: str, filename: str = "unknown") -> array:
         """Assemble assembly code into machine code."""
         try:
             logger.info("Assembling code from %s (%d characters)", filename, len(code))
@@ -60,22 +62,18 @@ class Assembler:
 def load_code(path: str) -> str:
     """Load assembly code from a file."""
     try:
-        file_path = Path(path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File '{path}' not found")
-
-        if file_path.stat().st_size == 0:
-            logger.warning("File '%s' is empty", path)
-
-        with file_path.open("r", encoding="utf-8") as f:
+        # Open directly and stat the open descriptor instead of probing the path first
+        with Path(path).open("r", encoding="utf-8") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                logger.warning("File '%s' is empty", path)
             content = f.read()
 
         logger.debug("Loaded %d bytes from %s", len(content), path)
         return content
 
-    except FileNotFoundError as e:
+    except FileNotFoundError:
         logger.error("File not found: %s", path)
-        print(f"Error: {e}", file=sys.stderr)
+        print(f"Error: File '{path}' not found", file=sys.stderr)
         sys.exit(1)
     except IOError as e:
         logger.error("I/O error reading %s: %s", path, e)
@@ -87,7 +85,7 @@ def load_code(path: str) -> str:
         sys.exit(1)
 
 
-def store_program(binary_code: list[str], output_path: str) -> None:
+def store_program(binary_code: array, output_path: str) -> None:
     """Store the compiled program as 16-bit binary numbers in a text file."""
     try:
         output_file = Path(output_path)
@@ -95,11 +93,16 @@ def store_program(binary_code: list[str], output_path: str) -> None:
             parents=True, exist_ok=True
         )  # Create directories if needed
 
+        # Format each instruction as two 8-bit groups separated by space
+        byte_bits = _BYTE_BITS
+        content = "".join(
+            [
+                f"{byte_bits[instruction >> 8]} {byte_bits[instruction & 0xFF]}\n"
+                for instruction in binary_code
+            ]
+        )
         with output_file.open("w", encoding="utf-8") as f:
-            for i, instruction in enumerate(binary_code):
-                # Format as two 8-bit groups separated by space
-                formatted_instruction = f"{instruction[:8]} {instruction[8:]}"
-                f.write(formatted_instruction + "\n")
+            f.write(content)
 
         logger.info(
             "Successfully wrote %d instructions to %s", len(binary_code), output_path
@@ -142,8 +145,11 @@ def setup_argument_parser():
 def main() -> int:
     parser = setup_argument_parser()
     args = parser.parse_args()
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG)
+    # Configured here rather than at import, so using the assembler as a library
+    # leaves logging setup to the caller
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO, format=LOG_FORMAT
+    )
     input_path = args.input_file
 
     # Validate input file extension
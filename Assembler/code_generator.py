@@ -4,58 +4,100 @@ from errors import (
     UndefinedLabelError,
 )
 from load_instructions import InstructionLoader
-from utils import get_number, get_register_number
-from constants import AssemblerConstants
+from parser import Instruction, Label, Statement
+from utils import Token, get_number, get_register_number
+from constants import MAX_PROGRAM_SIZE, TRANSFORMATIONS
 import re
-from functools import reduce
+from array import array
+from functools import lru_cache
+from typing import Callable, Mapping
+
+
+_PLACEHOLDER_PATTERN = re.compile(r"[RNA]_*")
+_PLACEHOLDER_TO_ZERO = str.maketrans("RNA_", "0000")
+
+# Reads the value of an operand token; None stands for an address operand, which
+# is read against the symbol table of the generator
+OperandReader = Callable[[Token], int] | None
+# Template literal bits and a (reader, shift, mask) entry for every operand
+Encoder = tuple[int, tuple[tuple[OperandReader, int, int], ...]]
 
 
 class AssemblerCodeGenerator:
     """Generates machine code from parsed assembly program.
 
     Attributes:
-        instructions (dict): Loaded instruction specifications from json file
+        instructions (Mapping): Loaded instruction specifications from json file
         symbol_table (dict): Mapping of label names to memory addresses
         program (list): Parsed assembly program
     """
 
-    def __init__(self, program: list[dict]):
+    # Encoders for the most recently loaded instruction table, shared by generators
+    _encoder_cache: tuple[Mapping[str, dict], dict[str, Encoder]] | None = None
+
+    def __init__(self, program: list[Statement]):
         self.instructions = InstructionLoader.load_instructions()
         self.symbol_table = {}
         self.program = program
+        self._encoders = self._shared_encoders(self.instructions)
+
+    @classmethod
+    def _shared_encoders(cls, instructions: Mapping[str, dict]) -> dict[str, Encoder]:
+        """Return the encoder cache for an instruction table.
 
-    def _resolve_labels(self) -> None:
-        """First pass: build symbol table with label addresses and validate program length.
+        Encoders only depend on the instruction specifications, so generators built
+        on the same (cached) table reuse the encoders compiled by earlier ones.
+        """
+        cache = cls._encoder_cache
+        if cache is None or cache[0] is not instructions:
+            cache = cls._encoder_cache = (instructions, {})
+        return cache[1]
+
+    def _define_label(self, line: Label, address: int) -> None:
+        """Add a label to the symbol table.
 
         Raises:
-            DuplicateLabelError: If a label is defined multiple times
-            ProgramTooLongError: If program exceeds MAX_PROGRAM_SIZE instructions
+            DuplicateLabelError: If the label is already defined
         """
-        address = 0
-        for line in self.program:
-            line_type = line["type"]
-
-            if line_type == "label":
-                if line["label"] in self.symbol_table:
-                    raise DuplicateLabelError(
-                        f"label {line['label']} already exists", line["line"]
-                    )
-                self.symbol_table[line["label"]] = address
-
-            elif line_type == "instruction":
-                address += 1
-                if address > AssemblerConstants.MAX_PROGRAM_SIZE:
-                    raise ProgramTooLongError(
-                        f"Program exceeds maximum size of {AssemblerConstants.MAX_PROGRAM_SIZE} "
-                        f"instructions (current: {address})",
-                        line["line"],
-                    )
+        if line.label in self.symbol_table:
+            raise DuplicateLabelError(f"label {line.label} already exists", line.line)
+        self.symbol_table[line.label] = address
+
+    @staticmethod
+    def _check_program_size(line: Statement, size: int) -> None:
+        """Validate that the program with size instructions fits in program memory.
+
+        Raises:
+            ProgramTooLongError: If size exceeds MAX_PROGRAM_SIZE instructions
+        """
+        if size > MAX_PROGRAM_SIZE:
+            raise ProgramTooLongError(
+                f"Program exceeds maximum size of {MAX_PROGRAM_SIZE} "
+                f"instructions (current: {size})",
+                line.line,
+            )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _template_layout(template: str) -> tuple[int, tuple[tuple[int, int], ...]]:
+        """Split a code template into its literal bits and placeholder fields.
+
+        Returns:
+            The literal bits of the template as an integer, with placeholder bits
+            cleared, and a (shift, mask) field for every placeholder, in the order
+            they are filled by the operands.
+        """
+        width = len(template)
+        fields = tuple(
+            (width - match.end(), (1 << len(match.group(0))) - 1)
+            for match in _PLACEHOLDER_PATTERN.finditer(template)
+        )
+        return int(template.translate(_PLACEHOLDER_TO_ZERO), 2), fields
 
     @staticmethod
     def _int_to_bin(number: int, n_bits: int) -> str:
         """Convert integer to n_bits-wide binary string using U2 for negatives."""
-        if number < 0:
-            number = (1 << n_bits) + number  # wrap around for negative values
+        # masking also wraps negative values
         return format(number & ((1 << n_bits) - 1), f"0{n_bits}b")
 
     @staticmethod
@@ -72,90 +114,202 @@ class AssemblerCodeGenerator:
         Returns:
             Transformed numeric value
         """
-        if transformations is None:
+        if not transformations:
+            return num
+
+        return AssemblerCodeGenerator._compile_transformations(tuple(transformations))(
+            num
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _compile_transformations(
+        transformations: tuple[str, ...],
+    ) -> Callable[[int], int]:
+        """Compose a sequence of transformations into a single callable.
+
+        Args:
+            transformations: Names of transformations, in the order they are applied
+
+        Returns:
+            Function applying all transformations to a numeric value
+        """
+        functions = tuple(TRANSFORMATIONS[name] for name in transformations)
+        if len(functions) == 1:
+            return functions[0]
+
+        def transform(num: int) -> int:
+            for function in functions:
+                num = function(num)
             return num
 
-        return reduce(lambda n, t: AssemblerConstants.TRANSFORMATIONS[t](n), transformations, num)
+        return transform
 
     @staticmethod
     def _replace_placeholder(template: str, start_character: str, number: int) -> str:
         """Replace a placeholder pattern in the template with a binary number."""
-        replaced = re.sub(
-            rf"{start_character}_*",
-            lambda m: AssemblerCodeGenerator._int_to_bin(number, len(m.group(0))),
-            template,
-            count=1
-        )
-        return replaced
+        start = template.find(start_character)
+        if start == -1:
+            return template
 
-    def generate_code(self) -> list[str]:
+        # The placeholder extends over the run of "_" following its character
+        end = start + 1
+        while end < len(template) and template[end] == "_":
+            end += 1
+
+        bits = AssemblerCodeGenerator._int_to_bin(number, end - start)
+        return template[:start] + bits + template[end:]
+
+    def generate_code(self) -> array:
         """Generate machine code.
 
-        Performs two-pass assembly:
-        1. Resolves labels and validates program length
-        2. Generates machine code for each instruction line
+        Walks the program once, defining labels and encoding instructions as they
+        appear. Address operands referencing labels that are not yet defined are
+        recorded as fixups and patched after the walk, once the symbol table is
+        complete.
 
         Returns:
-            List of binary strings representing the machine code program
+            Array of unsigned 16-bit instruction words making up the machine code
+
+        Raises:
+            DuplicateLabelError: If a label is defined multiple times
+            ProgramTooLongError: If program exceeds MAX_PROGRAM_SIZE instructions
+            UndefinedLabelError: If referenced label doesn't exist in symbol table
         """
-        self._resolve_labels()
-        machine_code = [
-            self.generate_instruction(line)
-            for line in self.program
-            if line["type"] == "instruction"
-        ]
+        machine_code = array("H")
+        fixups: list[tuple[int, Token, int, int]] = []
+
+        # Bound once, this loop runs for every line of the program
+        define_label = self._define_label
+        encode_instruction = self._encode_instruction
+        emit = machine_code.append
+        max_program_size = MAX_PROGRAM_SIZE
+
+        for line in self.program:
+            if isinstance(line, Instruction):
+                address = len(machine_code)
+                if address >= max_program_size:
+                    self._check_program_size(line, address + 1)
+                emit(encode_instruction(line, fixups, address))
+
+            elif isinstance(line, Label):
+                define_label(line, len(machine_code))
+
+        for address, operand, shift, mask in fixups:
+            machine_code[address] |= (self._label_address(operand) & mask) << shift
+
         return machine_code
 
-    def generate_instruction(self, instruction: dict) -> str:
+    def generate_instruction(self, instruction: Instruction) -> int:
         """Generate machine code for single instruction.
 
         Args:
-            instruction: Dictionary returned by parser
+            instruction: Instruction record returned by parser
 
         Returns:
-            16-bit binary string representing the machine code for this instruction
+            16-bit instruction word representing the machine code for this instruction
 
         Raises:
 
             UndefinedLabelError: If referenced label doesn't exist in symbol table
         """
-        mnemonic = instruction["mnemonic"].upper()
-        instruction_spec = self.instructions.get(mnemonic)
-        code_template = instruction_spec["code_template"]
-        binary_code = code_template
-
-        # Process each operand
-        for i, (operand, operand_spec) in enumerate(
-            zip(instruction["arguments"], instruction_spec.get("operands"))
-        ):
+        return self._encode_instruction(instruction)
+
+    def _label_address(self, operand: Token) -> int:
+        """Look up the address of the label referenced by operand.
+
+        Raises:
+            UndefinedLabelError: If referenced label doesn't exist in symbol table
+        """
+        address = self.symbol_table.get(operand.value)
+        if address is None:
+            raise UndefinedLabelError(
+                f"Undefined label: {operand.value}",
+                line=operand.line,
+                column=operand.start_column,
+            )
+        return address
+
+    def _read_address(self, operand: Token) -> int | None:
+        """Read address operand, returning None for a label not yet defined."""
+        if operand.type != "IDENT":
+            return get_number(operand)
+        return self.symbol_table.get(operand.value)
+
+    def _compile_encoder(self, mnemonic: str) -> Encoder:
+        """Build the encoder for an instruction from its specification.
+
+        Everything fixed by the specification (placeholder fields, operand types and
+        transformations) is resolved here once per mnemonic, so encoding an
+        instruction only has to read each operand and merge its bits.
+
+        Args:
+            mnemonic: Upper-case instruction mnemonic
+
+        Returns:
+            Template literal bits and a (reader, shift, mask) entry for every operand
+        """
+        instruction_spec = self.instructions[mnemonic]
+        literal_bits, fields = self._template_layout(instruction_spec["code_template"])
+
+        operand_plan = []
+        for operand_spec, (shift, mask) in zip(instruction_spec["operands"], fields):
             match operand_spec["type"]:
                 case "reg":
-                    reg_num = get_register_number(operand)
-                    binary_code = self._replace_placeholder(binary_code, "R", reg_num)
-
+                    read = get_register_number
                 case "num":
-                    num = get_number(operand)
-                    if "transformations" in operand_spec:
-                        transformed_num = self._transform_operand(
-                            num, operand_spec["transformations"]
+                    transformations = operand_spec.get("transformations")
+                    if transformations:
+                        transform = self._compile_transformations(
+                            tuple(transformations)
                         )
+                        read = lambda operand, f=transform: f(get_number(operand))
                     else:
-                        transformed_num = num
-                    binary_code = self._replace_placeholder(
-                        binary_code, "N", transformed_num
-                    )
-
+                        read = get_number
                 case "adr":
-                    if operand.type == "IDENT":
-                        adr = self.symbol_table.get(operand.value)
-                        if adr is None:
-                            raise UndefinedLabelError(
-                                f"Undefined label: {operand.value}",
-                                line=operand.line,
-                                column=operand.start_column,
-                            )
-                    else:
-                        adr = get_number(operand)
-                    binary_code = self._replace_placeholder(binary_code, "A", adr)
+                    read = None
+            operand_plan.append((read, shift, mask))
+
+        return literal_bits, tuple(operand_plan)
+
+    def _encode_instruction(
+        self,
+        instruction: Instruction,
+        fixups: list[tuple[int, Token, int, int]] | None = None,
+        address: int = 0,
+    ) -> int:
+        """Encode single instruction into its instruction word.
+
+        Args:
+            instruction: Instruction record returned by parser
+            fixups: If given, label operands not yet in the symbol table are left
+                unfilled and recorded here as (address, operand, shift, mask)
+            address: Address of the instruction, recorded with its fixups
+
+        Returns:
+            16-bit instruction word
+
+        Raises:
+            UndefinedLabelError: If fixups is None and a referenced label doesn't
+                exist in symbol table
+        """
+        # Encoders are keyed by mnemonic, so the specification lookup only
+        # happens the first time a mnemonic is seen
+        mnemonic = instruction.mnemonic
+        encoder = self._encoders.get(mnemonic)
+        if encoder is None:
+            encoder = self._encoders[mnemonic] = self._compile_encoder(mnemonic)
+        code, operand_plan = encoder
+
+        for operand, (read, shift, mask) in zip(instruction.arguments, operand_plan):
+            value = self._read_address(operand) if read is None else read(operand)
+            if value is None:
+                if fixups is None:
+                    self._label_address(operand)  # raises UndefinedLabelError
+                fixups.append((address, operand, shift, mask))
+                continue
+
+            # masking also wraps negative values to their U2 form
+            code |= (value & mask) << shift
 
-        return binary_code
+        return code
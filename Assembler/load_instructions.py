@@ -1,23 +1,39 @@
 import json
-import re
+import os
+import sys
 from pathlib import Path
 from functools import lru_cache
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 from errors import InstructionFormatError
 
+# Resolved once at import; find_root() starts its search here by default
+try:
+    _MODULE_DIR: Path | None = Path(__file__).resolve().parent
+except NameError:
+    _MODULE_DIR = None
+
+# Deletes template literal bits; whatever is left after translating is a placeholder
+_DELETE_LITERAL_BITS = str.maketrans("", "", "01")
+
+# Last validated content of every instructions file and the table built from it, by
+# path resolved against the repository root; unlike the lru_cache on
+# load_instructions this survives clear_cache()
+_VALIDATED: dict[str, tuple[bytes, Mapping[str, Any]]] = {}
+
 
 class InstructionLoader:
     _INSTRUCTION_REQUIRED_FIELDS = {"mnemonic", "operands", "code_template"}
     _VALID_OPERAND_TYPES = {"num", "reg", "adr"}
+    _TYPE_TO_PLACEHOLDER = {"reg": "R", "num": "N", "adr": "A"}
     _VALID_TRANSFORMATIONS = {"div2", "neq", "dec"}
     _CODE_TEMPLATE_LENGTH = 16
-    _CODE_TEMPLATE_ALLOWED_CHARS = set("01ANR_")
     FILE_PATH = "instructions.json"  # relative to project root
     REPO_ROOT_INDICATORS = {".git"}
 
     @staticmethod
     @lru_cache(maxsize=1)
-    def load_instructions(path: str | Path = FILE_PATH) -> dict[str, Any]:
+    def load_instructions(path: str | Path = FILE_PATH) -> Mapping[str, Any]:
         """
         Load and validate instructions from a JSON file.
 
@@ -29,18 +45,31 @@ class InstructionLoader:
                   the git repository root.
 
         Returns:
-            Dictionary mapping instruction mnemonics to their full definition.
+            Read-only mapping of instruction mnemonics to their full definition. The
+            result is cached and shared by all callers; once the cache is cleared the
+            file is read again, but unchanged content is not parsed and validated
+            again.
 
         Raises:
             FileNotFoundError: If the instructions file cannot be found
             InstructionFormatError: If the file content fails validation
             OSError: If there are file reading issues
         """
-        content = InstructionLoader._load_file(path)
-        InstructionLoader._validate_instructions_file(content)
-
-        # Convert list to dictionary keyed by mnemonic
-        return {item["mnemonic"]: item for item in content}
+        file_path = InstructionLoader._resolve_path(path)
+        key = str(file_path)
+        data = InstructionLoader._load_file(file_path)
+
+        # Skip parsing and validation if exactly these bytes were validated before
+        validated = _VALIDATED.get(key)
+        if validated is not None and validated[0] == data:
+            return validated[1]
+
+        content = InstructionLoader._parse_file(data, key)
+        instructions = MappingProxyType(
+            InstructionLoader._validate_instructions_file(content)
+        )
+        _VALIDATED[key] = (data, instructions)
+        return instructions
 
     @staticmethod
     @lru_cache(maxsize=1)
@@ -63,17 +92,17 @@ class InstructionLoader:
         """
         if start_dir is not None:
             current_dir = Path(start_dir).resolve()
+        elif _MODULE_DIR is not None:
+            current_dir = _MODULE_DIR
         else:
-            try:
-                current_dir = Path(__file__).resolve().parent
-            except NameError as exc:
-                raise NameError(
-                    "__file__ is not defined in this execution context; provide start_dir explicitly"
-                ) from exc
-
-        for candidate in InstructionLoader._iter_dirs_upwards(current_dir):
-            for target in InstructionLoader.REPO_ROOT_INDICATORS:
-                if (candidate / target).exists():
+            raise NameError(
+                "__file__ is not defined in this execution context; provide start_dir explicitly"
+            )
+
+        indicators = InstructionLoader.REPO_ROOT_INDICATORS
+        for candidate in (current_dir, *current_dir.parents):
+            for target in indicators:
+                if os.path.exists(os.path.join(candidate, target)):
                     return candidate
 
         raise FileNotFoundError(
@@ -87,46 +116,38 @@ class InstructionLoader:
         InstructionLoader.load_instructions.cache_clear()
 
     @staticmethod
-    def _iter_dirs_upwards(start: Path):
-        """Yield start then each parent up to the filesystem root (inclusive)."""
-        yield start
-        for p in start.parents:
-            yield p
+    def _resolve_path(path: str | Path) -> Path:
+        """Resolve path relative to the git repository root unless it is absolute."""
+        path_file = Path(path)
+        if path_file.is_absolute():
+            return path_file
+        return InstructionLoader.find_root() / path_file
 
     @staticmethod
-    def _load_file(path: str | Path) -> list[dict[str, Any]]:
+    def _load_file(file_path: Path) -> bytes:
         """
-        Load instruction specifications from a JSON file.
-
-        Resolves the file path relative to the git repository root and parses JSON content.
-        Results are cached for performance.
+        Read the raw content of an instructions file.
 
         Args:
-            path: Path to the JSON file. Relative paths are resolved from git root.
+            file_path: Path to the JSON file, already resolved by _resolve_path.
 
         Returns:
-            List of instruction dictionaries parsed from JSON.
+            Content of the file as bytes.
 
         Raises:
             FileNotFoundError: If the file doesn't exist
-            InstructionFormatError: If JSON is invalid or path is a directory
+            InstructionFormatError: If path is a directory
             OSError: For other file reading errors
         """
         root = InstructionLoader.find_root()
-        path_file = Path(path)
-        file_path = path_file if path_file.is_absolute() else (root / path_file)
 
         try:
-            with file_path.open("r", encoding="utf-8") as fh:
-                content = json.load(fh)
+            with file_path.open("rb") as fh:
+                return fh.read()
         except FileNotFoundError as exc:
             raise FileNotFoundError(
                 f"Instructions file '{file_path}' not found under repository root '{root}'."
             ) from exc
-        except json.JSONDecodeError as exc:
-            raise InstructionFormatError(
-                f"Invalid JSON in '{file_path}': {exc}"
-            ) from exc
         except IsADirectoryError as exc:
             raise InstructionFormatError(
                 f"Expected a file but found a directory at '{file_path}'"
@@ -134,34 +155,63 @@ class InstructionLoader:
         except OSError as exc:
             raise OSError(f"Unable to read '{file_path}': {exc}") from exc
 
-        return content
+    @staticmethod
+    def _parse_file(data: bytes, file_path: str) -> list[dict[str, Any]]:
+        """
+        Parse the JSON content of an instructions file.
+
+        Args:
+            data: Raw file content
+            file_path: Path of the file (for error context)
+
+        Returns:
+            List of instruction dictionaries parsed from JSON.
+
+        Raises:
+            InstructionFormatError: If JSON is invalid
+        """
+        try:
+            # json.loads detects the UTF encoding of bytes itself
+            return json.loads(data)
+        except json.JSONDecodeError as exc:
+            raise InstructionFormatError(
+                f"Invalid JSON in '{file_path}': {exc}"
+            ) from exc
 
     # ==================================================
     # Section: Instructions File Validation
     # ==================================================
 
     @staticmethod
-    def _validate_instructions_file(content: list[dict[str, Any]]) -> None:
+    def _validate_instructions_file(
+        content: list[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
         """
         Validate the overall structure and content of instructions file.
 
         Args:
             content: List of instruction dictionaries to validate
 
+        Returns:
+            Dictionary mapping instruction mnemonics to their definition, built while
+            validating.
+
         Raises:
             InstructionFormatError: If content fails validation
         """
         if not isinstance(content, list):
             raise InstructionFormatError("Instructions content must be a list")
 
-        seen_mnemonics = set()
+        instructions: dict[str, dict[str, Any]] = {}
 
         for i, instruction in enumerate(content):
             InstructionLoader._validate_instruction_structure(instruction, i)
             InstructionLoader._validate_instruction_content(
-                instruction, i, seen_mnemonics
+                instruction, i, instructions
             )
 
+        return instructions
+
     @staticmethod
     def _validate_instruction_structure(
         instruction: dict[str, Any], index: int
@@ -190,7 +240,9 @@ class InstructionLoader:
 
     @staticmethod
     def _validate_instruction_content(
-        instruction: dict[str, Any], index: int, seen_mnemonics: set[str]
+        instruction: dict[str, Any],
+        index: int,
+        instructions: dict[str, dict[str, Any]],
     ) -> None:
         """
         Validate the content of an instruction including mnemonic, operands, and template.
@@ -198,7 +250,8 @@ class InstructionLoader:
         Args:
             instruction: Instruction dictionary to validate
             index: Index of the instruction in the list (for error reporting)
-            seen_mnemonics: Set of mnemonics already encountered (for duplicate detection)
+            instructions: Instructions validated so far, keyed by mnemonic; the
+                instruction is added to it once its mnemonic is checked
 
         Raises:
             InstructionFormatError: If content is invalid
@@ -212,9 +265,10 @@ class InstructionLoader:
             )
 
         # Check for duplicate mnemonics
-        if mnemonic in seen_mnemonics:
+        if mnemonic in instructions:
             raise InstructionFormatError(f"Duplicate mnemonic found: '{mnemonic}'")
-        seen_mnemonics.add(mnemonic)
+        # Interned like the mnemonic tokens, so table lookups match by identity
+        instructions[sys.intern(mnemonic)] = instruction
 
         # Validate operands
         InstructionLoader._validate_operands(instruction["operands"], mnemonic)
@@ -241,6 +295,8 @@ class InstructionLoader:
                 f"Instruction '{mnemonic}' operands must be a list"
             )
 
+        valid_operand_types = InstructionLoader._VALID_OPERAND_TYPES
+
         for j, operand in enumerate(operands):
             if not isinstance(operand, dict):
                 raise InstructionFormatError(
@@ -251,45 +307,44 @@ class InstructionLoader:
                 raise InstructionFormatError(
                     f"Instruction '{mnemonic}' operand {j} is missing 'type' field"
                 )
-            if operand["type"] not in InstructionLoader._VALID_OPERAND_TYPES:
+            operand_type = operand["type"]
+            if operand_type not in valid_operand_types:
                 raise InstructionFormatError(
-                    f"Instruction '{mnemonic}' operand {j} type '{operand['type']}' is not a valid operand type"
+                    f"Instruction '{mnemonic}' operand {j} type '{operand_type}' is not a valid operand type"
                 )
 
-            # Validate numeric operands
-            if operand["type"] == "num":
-                if "range" not in operand:
-                    raise InstructionFormatError(
-                        f"Number operand {j} is missing 'range' field"
-                    )
-                range_val = operand["range"]
-                if (
-                    not isinstance(range_val, list)
-                    or len(range_val) != 2
-                    or not all(isinstance(x, int) for x in range_val)
-                    or range_val[0] > range_val[1]
+            # Only numeric operands carry fields beyond their type
+            if operand_type != "num":
+                continue
+
+            if "range" not in operand:
+                raise InstructionFormatError(f"Number operand {j} is missing 'range' field")
+            range_val = operand["range"]
+            if (
+                not isinstance(range_val, list)
+                or len(range_val) != 2
+                or type(range_val[0]) is not int
+                or type(range_val[1]) is not int
+                or range_val[0] > range_val[1]
+            ):
+                raise InstructionFormatError(
+                    f"Instruction '{mnemonic}' operand {j} has invalid range: must be [min, max] where min <= max and both are integers"
+                )
+
+            if "transformations" in operand:
+                transformations = operand["transformations"]
+                if not isinstance(transformations, list) or not all(
+                    isinstance(t, str) for t in transformations
                 ):
                     raise InstructionFormatError(
-                        f"Instruction '{mnemonic}' operand {j} has invalid range: must be [min, max] where min <= max and both are integers"
+                        f"Instruction '{mnemonic}' operand {j} transformations must be a list of strings"
                     )
-
-                if "transformations" in operand:
-                    transformations = operand["transformations"]
-                    if not isinstance(transformations, list) or not all(
-                        isinstance(t, str) for t in transformations
-                    ):
+                for transformation in transformations:
+                    if transformation not in InstructionLoader._VALID_TRANSFORMATIONS:
                         raise InstructionFormatError(
-                            f"Instruction '{mnemonic}' operand {j} transformations must be a list of strings"
+                            f"Instruction '{mnemonic}' operand {j} has invalid transformation: '{transformation}'. "
+                            f"Valid transformations are: {InstructionLoader._VALID_TRANSFORMATIONS}"
                         )
-                    for transformation in transformations:
-                        if (
-                            transformation
-                            not in InstructionLoader._VALID_TRANSFORMATIONS
-                        ):
-                            raise InstructionFormatError(
-                                f"Instruction '{mnemonic}' operand {j} has invalid transformation: '{transformation}'. "
-                                f"Valid transformations are: {InstructionLoader._VALID_TRANSFORMATIONS}"
-                            )
 
     @staticmethod
     def _validate_code_template(
@@ -314,30 +369,39 @@ class InstructionLoader:
                 f"Instruction '{mnemonic}' code_template must be a {InstructionLoader._CODE_TEMPLATE_LENGTH}-character string"
             )
 
-        # Create a working copy of the template for validation
-        remaining_template = code_template
+        # Walk the template once; placeholders must appear in operand order with
+        # only literal bits between them
+        template_length = len(code_template)
+        type_to_placeholder = InstructionLoader._TYPE_TO_PLACEHOLDER
+        cursor = 0
 
         for i, operand in enumerate(operands):
             operand_type = operand["type"]
-            expected_placeholder = {"reg": "R", "num": "N", "adr": "A"}[operand_type]
+            expected_placeholder = type_to_placeholder[operand_type]
 
-            # Find the first occurrence of the expected placeholder
-            pattern = rf"{expected_placeholder}_*"
-            match = re.search(pattern, remaining_template)
-            pos = match.start()
-            length = len(match.group(0))
+            # Skip the literal bits before the next placeholder
+            while cursor < template_length and code_template[cursor] in "01":
+                cursor += 1
 
-            if pos == -1:
+            if cursor == template_length:
+                raise InstructionFormatError(
+                    f"Instruction '{mnemonic}' operand {i} (type: {operand_type}) requires "
+                    f"placeholder '{expected_placeholder}' but none found in remaining template: {code_template[cursor:]}"
+                )
+            if code_template[cursor] != expected_placeholder:
                 raise InstructionFormatError(
                     f"Instruction '{mnemonic}' operand {i} (type: {operand_type}) requires "
-                    f"placeholder '{expected_placeholder}' but none found in remaining template: {remaining_template}"
+                    f"placeholder '{expected_placeholder}' but found '{code_template[cursor]}' "
+                    f"at position {cursor} of template: {code_template}"
                 )
 
-            # Remove the matched portion from the template (everything up to and including the placeholder)
-            remaining_template = remaining_template[pos + length :]
+            # The placeholder extends over the run of "_" following its character
+            cursor += 1
+            while cursor < template_length and code_template[cursor] == "_":
+                cursor += 1
 
         # After processing all operands, check if there are any unexpected characters left
-        if not set(remaining_template) <= {"0", "1"}:
+        if code_template[cursor:].translate(_DELETE_LITERAL_BITS):
             raise InstructionFormatError(
                 f"Instruction '{mnemonic}' has unmatched placeholders in template. "
                 f"Template: {code_template}, Operands: {[op['type'] for op in operands]}"
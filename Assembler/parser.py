@@ -1,7 +1,61 @@
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
+
 from errors import InvalidSyntaxError
 from tokenizer import Token
 
 
+@dataclass(slots=True)
+class Label:
+    """Represents a label definition in the parsed program.
+
+    Attributes:
+        label: Label name without the trailing colon (e.g., '.loop').
+        line: Line number where the label appears (1-indexed).
+        column: Starting column of the label (1-indexed).
+    """
+
+    type: ClassVar[str] = "label"
+
+    label: str
+    line: int
+    column: int
+
+
+@dataclass(slots=True)
+class Instruction:
+    """Represents an instruction with its operands in the parsed program.
+
+    Attributes:
+        mnemonic: Upper-case instruction mnemonic.
+        arguments: Operand tokens in source order.
+        line: Line number where the instruction appears (1-indexed).
+        column: Starting column of the mnemonic (1-indexed).
+    """
+
+    type: ClassVar[str] = "instruction"
+
+    mnemonic: str
+    arguments: list[Token]
+    line: int
+    column: int
+
+
+Statement = Label | Instruction
+
+
+def make_label(label: str, line: int = 1, column: int = 1) -> Label:
+    return Label(label=label, line=line, column=column)
+
+
+def make_instruction(
+    mnemonic: str, arguments: list[Token], line: int = 1, column: int = 1
+) -> Instruction:
+    return Instruction(mnemonic=mnemonic, arguments=arguments, line=line, column=column)
+
+
 class AssemblerParser:
     """Parses tokens into program structure with labels and instructions.
 
@@ -18,80 +72,115 @@ class AssemblerParser:
         self.pos = 0
         self.line = 0
 
-    def _advance(self) -> Token | None:
-        """Advance to the next token and return it."""
-        if self.pos >= len(self.tokens):
-            return None
-        tok = self.tokens[self.pos]
-        self.line = tok.line
-        self.pos += 1
-        return tok
-
-    def _collect_operands(self) -> list[Token]:
-        """Collect all operands for the current instruction."""
-        operands = []
-        current_line = self.line
-
-        while True:
-            prev_pos = self.pos
-            prev_line = self.line
-            tok = self._advance()
-            if tok is None:
-                break
-            if tok.line != current_line:
-                self.pos = prev_pos
-                self.line = prev_line
-                break
-            if tok.type in AssemblerParser._VALID_OPERAND_TYPES:
-                operands.append(tok)
-            else:
-                raise InvalidSyntaxError(
-                    f"Unexpected token type {tok.type} with value {tok.value!r}",
-                    line=tok.line,
-                    column=tok.start_column,
-                )
-        return operands
-
-    def parse_line(self) -> dict | None:
-        """Parse the current line of assembly code."""
-        tok = self._advance()
-        if not tok:
+    @staticmethod
+    def _unexpected_token(tok: Token) -> InvalidSyntaxError:
+        """Build the error raised for a token that cannot appear where it is."""
+        return InvalidSyntaxError(
+            f"Unexpected token type {tok.type} with value {tok.value!r}",
+            line=tok.line,
+            column=tok.start_column,
+        )
+
+    def _line_starts(self) -> list[int]:
+        """Return the index of the first token of every line and len(tokens)."""
+        tokens = self.tokens
+        starts = []
+        add_start = starts.append
+        last_line = None
+
+        for i, tok in enumerate(tokens):
+            line = tok.line
+            if line != last_line:
+                add_start(i)
+                last_line = line
+
+        add_start(len(tokens))
+        return starts
+
+    @staticmethod
+    def _make_label(tok: Token) -> Label:
+        """Build a label record."""
+        label = sys.intern(tok.value.removesuffix(":"))
+        return Label(label, tok.line, tok.start_column)
+
+    @staticmethod
+    def _make_instruction(tok: Token, operands: list[Token]) -> Instruction:
+        """Build an instruction record after checking the operand token types."""
+        valid_operand_types = AssemblerParser._VALID_OPERAND_TYPES
+        for operand in operands:
+            if operand.type not in valid_operand_types:
+                raise AssemblerParser._unexpected_token(operand)
+        # Mnemonics are matched case-insensitively, so they are upper-cased here
+        # for the validator, the code generator and the emulator's program loader
+        mnemonic = AssemblerParser._upper_mnemonic(tok.value)
+        return Instruction(mnemonic, operands, tok.line, tok.start_column)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _upper_mnemonic(mnemonic: str) -> str:
+        """Return the interned upper-case form of a mnemonic spelling."""
+        return sys.intern(mnemonic.upper())
+
+    # Builders of the statements taking operands, by the type of their first token;
+    # labels take none and are built directly
+    _STATEMENT_BUILDERS = {
+        "MNEMONIC": _make_instruction,
+    }
+
+    def _parse_statement(self, start: int, end: int) -> tuple[Statement, int]:
+        """Parse the statement at tokens[start] on the line ending before end.
+
+        A line holds labels followed by at most one instruction whose operands are
+        the remaining tokens of the line.
+
+        Returns:
+            The parsed statement and the index of the token following it.
+        """
+        tokens = self.tokens
+        tok = tokens[start]
+        if tok.type == "LABEL":
+            return self._make_label(tok), start + 1
+
+        build = AssemblerParser._STATEMENT_BUILDERS.get(tok.type)
+        if build is None:
+            raise self._unexpected_token(tok)
+        return build(tok, tokens[start + 1 : end]), end
+
+    def parse_line(self) -> Statement | None:
+        """Parse the label or instruction at the current position."""
+        tokens = self.tokens
+        start = self.pos
+        n_tokens = len(tokens)
+        if start >= n_tokens:
             return None
 
-        match tok.type:
-            case "LABEL":
-                return {
-                    "type": "label",
-                    "label": tok.value.removesuffix(":"),
-                    "line": tok.line,
-                    "column": tok.start_column,
-                }
-            case "MNEMONIC":
-                args = self._collect_operands()
-                return {
-                    "type": "instruction",
-                    "mnemonic": tok.value,
-                    "arguments": args,
-                    "line": tok.line,
-                    "column": tok.start_column,
-                }
-            case _:
-                raise InvalidSyntaxError(
-                    f"Unexpected token type {tok.type} with value {tok.value!r}",
-                    line=tok.line,
-                    column=tok.start_column,
-                )
-
-    def parse(self) -> list[dict]:
+        line = tokens[start].line
+        end = start + 1
+        while end < n_tokens and tokens[end].line == line:
+            end += 1
+
+        statement, self.pos = self._parse_statement(start, end)
+        self.line = line
+        return statement
+
+    def parse(self) -> list[Statement]:
         """Parses all tokens into a complete program structure.
 
         Returns:
-            List of dictionaries representing the parsed program with labels and instructions.
+            List of Label and Instruction records representing the parsed program.
         """
         program = []
-        while self.pos < len(self.tokens):
-            line = self.parse_line()
-            if line:
-                program.append(line)
+        add_line = program.append
+        parse_statement = self._parse_statement
+        tokens = self.tokens
+        line_starts = self._line_starts()
+
+        for start, end in zip(line_starts, line_starts[1:]):
+            while start < end:
+                statement, start = parse_statement(start, end)
+                add_line(statement)
 
+        self.pos = len(tokens)
+        if tokens:
+            self.line = tokens[-1].line
         return program
@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import patch, mock_open
 import json
+from array import array
 from code_generator import *
 from errors import *
 from tokenizer import make_tokens, make_token
+from parser import AssemblerParser, make_instruction, make_label
 from load_instructions import InstructionLoader
 
 
@@ -73,6 +75,7 @@ def mock_instructions():
         (0, 4, "0000"),
         (-1, 4, "1111"),  # negative
         (17, 4, "0001"),  # wrap around
+        (-2, 12, "111111111110"),  # wide negative value
     ],
 )
 def test_int_to_bin(number, bits, expected):
@@ -129,103 +132,107 @@ def test_replace_placeholder():
     assert result == "0000110100001010"
 
 
-def test_resolve_labels(mock_instructions):
-    """Test label resolution in first pass"""
+def test_template_layout():
+    """Test splitting template into literal bits and placeholder fields"""
+    literal_bits, fields = AssemblerCodeGenerator._template_layout("00001R__N_______")
+    assert literal_bits == 0b0000100000000000
+    assert fields == ((8, 0b111), (0, 0b11111111))
+
+
+def test_generate_code_defines_labels(mock_instructions):
+    """Test that labels get the address of the instruction following them"""
     program = [
-        {"type": "label", "label": "start", "line": 1},
-        {"type": "instruction", "mnemonic": "MOV", "arguments": [], "line": 1},
-        {"type": "label", "label": "loop", "line": 2},
-        {"type": "instruction", "mnemonic": "ADD", "arguments": [], "line": 2},
-        {"type": "instruction", "mnemonic": "JMP", "arguments": [], "line": 3},
+        make_label("start", 1),
+        make_instruction("MOV", [], 1),
+        make_label("loop", 2),
+        make_instruction("ADD", [], 2),
+        make_instruction("JMP", [], 3),
     ]
 
     generator = AssemblerCodeGenerator(program)
-    generator._resolve_labels()
+    generator.generate_code()
 
     assert generator.symbol_table == {"start": 0, "loop": 1}
 
 
-def test_resolve_labels_duplicate_error(mock_instructions):
+def test_generate_code_duplicate_label_error(mock_instructions):
     """Test duplicate labels raise an error"""
     program = [
-        {"type": "label", "label": "start", "line": 1},
-        {"type": "instruction", "mnemonic": "MOV", "arguments": [], "line": 1},
-        {"type": "label", "label": "start", "line": 2},  # Duplicate
+        make_label("start", 1),
+        make_instruction("MOV", [], 1),
+        make_label("start", 2),  # Duplicate
     ]
 
     generator = AssemblerCodeGenerator(program)
     with pytest.raises(DuplicateLabelError, match="label start already exists"):
-        generator._resolve_labels()
+        generator.generate_code()
 
 
 def test_generate_instruction_register_number(mock_instructions):
     """Test generating instruction with register and number operands"""
     program = [
-        {
-            "type": "instruction",
-            "mnemonic": "MOV",
-            "arguments": make_tokens([("REGISTER", "R2"), ("DEC", "100")]),
-            "line": 1,
-        }
+        make_instruction("MOV", make_tokens([("REGISTER", "R2"), ("DEC", "100")]), 1)
     ]
 
     generator = AssemblerCodeGenerator(program)
-    generator._resolve_labels()
 
     instruction_code = generator.generate_instruction(program[0])
-    assert instruction_code == "0000101001100100"  # R2=010, 100=01100100
+    assert instruction_code == 0b0000101001100100  # R2=010, 100=01100100
+
+
+def test_generate_instruction_lowercase_mnemonic(mock_instructions):
+    """Test that mnemonics are matched case-insensitively"""
+    tokens = make_tokens(
+        [("MNEMONIC", "mov", 1, 1), ("REGISTER", "R2", 1, 5), ("DEC", "100", 1, 9)]
+    )
+
+    generator = AssemblerCodeGenerator(AssemblerParser(tokens).parse())
+
+    assert generator.generate_code() == array("H", [0b0000101001100100])
+
+
+def test_encoders_shared_between_generators(mock_instructions):
+    """Test that generators on the same instruction table reuse compiled encoders"""
+    program = [
+        make_instruction("MOV", make_tokens([("REGISTER", "R2"), ("DEC", "100")]), 1)
+    ]
+
+    AssemblerCodeGenerator(program).generate_code()
+    generator = AssemblerCodeGenerator(program)
+
+    assert "MOV" in generator._encoders
+    assert generator.generate_code() == array("H", [0b0000101001100100])
 
 
 def test_generate_instruction_address_label(mock_instructions):
     """Test generating instruction with address label"""
     program = [
-        {"type": "label", "label": "target", "line": 1},
-        {
-            "type": "instruction",
-            "mnemonic": "JMP",
-            "arguments": [make_token("IDENT", "target")],
-            "line": 2,
-        },
+        make_label("target", 1),
+        make_instruction("JMP", [make_token("IDENT", "target")], 2),
     ]
 
     generator = AssemblerCodeGenerator(program)
-    generator._resolve_labels()
+    generator.generate_code()
 
     instruction_code = generator.generate_instruction(program[1])
-    assert instruction_code == "0001000000000000"  # Address 0
+    assert instruction_code == 0b0001000000000000  # Address 0
 
 
 def test_generate_instruction_address_number(mock_instructions):
     """Test generating instruction with numeric address"""
-    program = [
-        {
-            "type": "instruction",
-            "mnemonic": "JMP",
-            "arguments": [make_token("DEC", "42")],
-            "line": 1,
-        }
-    ]
+    program = [make_instruction("JMP", [make_token("DEC", "42")], 1)]
 
     generator = AssemblerCodeGenerator(program)
-    generator._resolve_labels()
 
     instruction_code = generator.generate_instruction(program[0])
-    assert instruction_code == "0001000000101010"
+    assert instruction_code == 0b0001000000101010
 
 
 def test_generate_instruction_undefined_label(mock_instructions):
     """Test that undefined label raises error"""
-    program = [
-        {
-            "type": "instruction",
-            "mnemonic": "JMP",
-            "arguments": [make_token("IDENT", "undefined")],
-            "line": 1,
-        }
-    ]
+    program = [make_instruction("JMP", [make_token("IDENT", "undefined")], 1)]
 
     generator = AssemblerCodeGenerator(program)
-    generator._resolve_labels()
 
     with pytest.raises(UndefinedLabelError, match="Undefined label: undefined"):
         generator.generate_instruction(program[0])
@@ -234,56 +241,65 @@ def test_generate_instruction_undefined_label(mock_instructions):
 def test_generate_instruction_with_transformations(mock_instructions):
     """Test generating instruction with operand transformations"""
     program = [
-        {
-            "type": "instruction",
-            "mnemonic": "ADI",
-            "arguments": make_tokens([("REGISTER", "R1"), ("DEC", "10")]),
-            "line": 1,
-        }
+        make_instruction("ADI", make_tokens([("REGISTER", "R1"), ("DEC", "10")]), 1)
     ]
 
     generator = AssemblerCodeGenerator(program)
-    generator._resolve_labels()
 
     instruction_code = generator.generate_instruction(program[0])
-    expected_code = "0010000100000100"
+    expected_code = 0b0010000100000100
     assert (
         instruction_code == expected_code
-    ), f"expected '{expected_code}' (10->div2=5->dec=4), got '{instruction_code}'"
+    ), f"expected {expected_code:016b} (10->div2=5->dec=4), got {instruction_code:016b}"
 
 
 def test_generate_code(mock_instructions):
     """Test complete code generation"""
     program = [
-        {"type": "label", "label": "start", "line": 1},
-        {
-            "type": "instruction",
-            "mnemonic": "MOV",
-            "arguments": make_tokens([("REGISTER", "R1"), ("DEC", "5")]),
-            "line": 2,
-        },
-        {"type": "label", "label": "loop", "line": 3},
-        {
-            "type": "instruction",
-            "mnemonic": "ADD",
-            "arguments": make_tokens([("REGISTER", "R1"), ("REGISTER", "R2")]),
-            "line": 4,
-        },
-        {
-            "type": "instruction",
-            "mnemonic": "JMP",
-            "arguments": [make_token("IDENT", "loop")],
-            "line": 5,
-        },
+        make_label("start", 1),
+        make_instruction("MOV", make_tokens([("REGISTER", "R1"), ("DEC", "5")]), 2),
+        make_label("loop", 3),
+        make_instruction(
+            "ADD", make_tokens([("REGISTER", "R1"), ("REGISTER", "R2")]), 4
+        ),
+        make_instruction("JMP", [make_token("IDENT", "loop")], 5),
     ]
 
     generator = AssemblerCodeGenerator(program)
     machine_code = generator.generate_code()
 
+    assert machine_code.typecode == "H"
     assert len(machine_code) == 3
-    assert machine_code[0] == "0000100100000101"  # MOV R1, 5
-    assert machine_code[1] == "0001100101000000"  # ADD R1, R2
-    assert machine_code[2] == "0001000000000001"  # JMP loop (address 1)
+    assert machine_code[0] == 0b0000100100000101  # MOV R1, 5
+    assert machine_code[1] == 0b0001100101000000  # ADD R1, R2
+    assert machine_code[2] == 0b0001000000000001  # JMP loop (address 1)
+
+
+def test_generate_code_forward_label(mock_instructions):
+    """Test that labels defined after their use are resolved"""
+    program = [
+        make_instruction("JMP", [make_token("IDENT", "end")], 1),
+        make_instruction(
+            "ADD", make_tokens([("REGISTER", "R1"), ("REGISTER", "R2")]), 2
+        ),
+        make_label("end", 3),
+        make_instruction("JMP", [make_token("IDENT", "end")], 4),
+    ]
+
+    generator = AssemblerCodeGenerator(program)
+    machine_code = generator.generate_code()
+
+    assert machine_code[0] == 0b0001000000000010  # JMP end (address 2)
+    assert machine_code[2] == 0b0001000000000010
+
+
+def test_generate_code_undefined_label(mock_instructions):
+    """Test that undefined label raises error during complete code generation"""
+    program = [make_instruction("JMP", [make_token("IDENT", "undefined")], 1)]
+
+    generator = AssemblerCodeGenerator(program)
+    with pytest.raises(UndefinedLabelError, match="Undefined label: undefined"):
+        generator.generate_code()
 
 
 def test_program_too_long(mock_instructions):
@@ -296,17 +312,14 @@ def test_program_too_long(mock_instructions):
     for i in range(1025):
         # Randomly decide whether to add a label before this instruction
         if random.random() < 0.15:  # 15% probability
-            program.append({"type": "label", "label": f"label_{i}", "line": line_num})
+            program.append(make_label(f"label_{i}", line_num))
             line_num += 1
 
         # Add the instruction
         program.append(
-            {
-                "type": "instruction",
-                "mnemonic": "MOV",
-                "arguments": make_tokens([("REGISTER", "R1"), ("DEC", "1")]),
-                "line": line_num,
-            }
+            make_instruction(
+                "MOV", make_tokens([("REGISTER", "R1"), ("DEC", "1")]), line_num
+            )
         )
         line_num += 1
 
@@ -315,4 +328,20 @@ def test_program_too_long(mock_instructions):
     with pytest.raises(
         ProgramTooLongError, match="Program exceeds maximum size of 1024 instructions"
     ):
-        generator._resolve_labels()
+        generator.generate_code()
+
+
+def test_program_too_long_points_at_first_instruction_not_fitting(mock_instructions):
+    """Test that the overflow reports the first instruction past the limit"""
+    program = [
+        make_instruction(
+            "MOV", make_tokens([("REGISTER", "R1"), ("DEC", "1")]), line_num
+        )
+        for line_num in range(1, 1100)
+    ]
+
+    with pytest.raises(ProgramTooLongError) as generate_error:
+        AssemblerCodeGenerator(program).generate_code()
+
+    assert "(current: 1025)" in str(generate_error.value)
+    assert generate_error.value.line == 1025
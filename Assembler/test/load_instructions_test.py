@@ -59,6 +59,44 @@ def test_load_instructions(my_fake_fs):
     assert instructions == expected
 
 
+def test_load_instructions_skips_revalidation(my_fake_fs):
+    """Test that an unchanged file is not validated again after clear_cache"""
+    first = InstructionLoader.load_instructions()
+    InstructionLoader.clear_cache()
+
+    with patch.object(InstructionLoader, "_validate_instructions_file") as validate:
+        second = InstructionLoader.load_instructions()
+
+    validate.assert_not_called()
+    assert second == first
+
+
+def test_load_instructions_relative_and_absolute_path_share_validation(my_fake_fs):
+    """Test that validated content is remembered by the path resolved from root"""
+    first = InstructionLoader.load_instructions()
+    InstructionLoader.clear_cache()
+
+    with patch.object(InstructionLoader, "_validate_instructions_file") as validate:
+        second = InstructionLoader.load_instructions(
+            InstructionLoader.find_root() / InstructionLoader.FILE_PATH
+        )
+
+    validate.assert_not_called()
+    assert second is first
+
+
+def test_load_instructions_validates_changed_content(my_fake_fs):
+    """Test that content differing from the validated one is validated again"""
+    InstructionLoader.load_instructions()
+    InstructionLoader.clear_cache()
+
+    with patch.object(
+        InstructionLoader, "_load_file", return_value=b'[{"bogus": 1}]'
+    ):
+        with pytest.raises(InstructionFormatError):
+            InstructionLoader.load_instructions()
+
+
 def test_load_instructions_file_not_found():
     """Test handling of missing instructions file"""
     with patch.object(
@@ -91,3 +129,29 @@ def test_load_instructions_file_read_error():
         mock_file.side_effect = OSError("Permission denied")
         with pytest.raises(OSError, match="Unable to read"):
             InstructionLoader.load_instructions()
+
+
+def test_validate_code_template_missing_placeholder():
+    """Test that a template without the placeholder an operand needs is rejected"""
+    with pytest.raises(InstructionFormatError, match=r".*requires placeholder 'R'.*"):
+        InstructionLoader._validate_code_template(
+            "0000000000000000", [{"type": "reg"}], "TEST"
+        )
+
+
+def test_validate_code_template_unmatched_placeholder():
+    """Test that a template with more placeholders than operands is rejected"""
+    with pytest.raises(InstructionFormatError, match=r".*unmatched placeholders.*"):
+        InstructionLoader._validate_code_template(
+            "00001N_______R__", [{"type": "num"}], "TEST"
+        )
+
+
+def test_validate_code_template_out_of_order_placeholder():
+    """Test that placeholders must appear in operand order"""
+    with pytest.raises(
+        InstructionFormatError, match=r".*requires placeholder 'N' but found 'R'.*"
+    ):
+        InstructionLoader._validate_code_template(
+            "00001R__N_______", [{"type": "num"}], "TEST"
+        )
@@ -14,7 +14,7 @@ def test_label():
     tokens = make_tokens([("LABEL", ".start:", 1, 1)])
     parser = AssemblerParser(tokens)
     result = parser.parse()
-    assert result == [{"type": "label", "label": ".start", "line": 1, "column": 1}]
+    assert result == [make_label(".start", 1, 1)]
 
 
 def test_parse_instruction():
@@ -25,14 +25,21 @@ def test_parse_instruction():
     result = parser.parse()
     assert len(result) == 1
     instr = result[0]
-    assert instr["type"] == "instruction"
-    assert instr["mnemonic"] == "MOV"
-    assert [tok for tok in instr["arguments"]] == [
+    assert isinstance(instr, Instruction)
+    assert instr.mnemonic == "MOV"
+    assert [tok for tok in instr.arguments] == [
         Token("REGISTER", "R1", 1, 5),
         Token("DEC", "10", 1, 8),
     ]
 
 
+def test_parse_instruction_uppercases_mnemonic():
+    tokens = make_tokens([("MNEMONIC", "mOv", 1, 1), ("REGISTER", "R1", 1, 5)])
+    parser = AssemblerParser(tokens)
+    result = parser.parse()
+    assert result[0].mnemonic == "MOV"
+
+
 def test_multiple_lines():
     tokens = make_tokens(
         [
@@ -45,5 +52,56 @@ def test_multiple_lines():
     parser = AssemblerParser(tokens)
     result = parser.parse()
     assert len(result) == 2
-    assert result[0]["type"] == "label"
-    assert result[1]["mnemonic"] == "ADD"
+    assert isinstance(result[0], Label)
+    assert result[1].mnemonic == "ADD"
+
+
+def test_label_and_instruction_on_one_line():
+    tokens = make_tokens(
+        [
+            ("LABEL", ".start:", 1, 1),
+            ("MNEMONIC", "JMP", 1, 9),
+            ("IDENT", ".start", 1, 13),
+        ]
+    )
+    parser = AssemblerParser(tokens)
+    result = parser.parse()
+    assert [type(line) for line in result] == [Label, Instruction]
+    assert result[1].arguments == [Token("IDENT", ".start", 1, 13)]
+
+
+def test_unexpected_operand():
+    tokens = make_tokens(
+        [("MNEMONIC", "ADD", 1, 1), ("REGISTER", "R1", 1, 5), ("LABEL", ".x:", 1, 9)]
+    )
+    parser = AssemblerParser(tokens)
+    with pytest.raises(InvalidSyntaxError) as exc_info:
+        parser.parse()
+    assert exc_info.value.column == 9
+
+
+def test_parse_line():
+    tokens = make_tokens(
+        [("LABEL", ".loop:", 1, 1), ("MNEMONIC", "HLT", 1, 8), ("MNEMONIC", "NOP", 2, 1)]
+    )
+    parser = AssemblerParser(tokens)
+    assert isinstance(parser.parse_line(), Label)
+    assert parser.parse_line().mnemonic == "HLT"
+    assert parser.parse_line().mnemonic == "NOP"
+    assert parser.parse_line() is None
+
+
+def test_parse_line_matches_parse():
+    tokens = make_tokens(
+        [
+            ("LABEL", ".loop:", 1, 1),
+            ("MNEMONIC", "jmp", 1, 8),
+            ("IDENT", ".loop", 1, 12),
+            ("MNEMONIC", "HLT", 2, 1),
+        ]
+    )
+    parser = AssemblerParser(tokens)
+    statements = []
+    while (statement := parser.parse_line()) is not None:
+        statements.append(statement)
+    assert statements == AssemblerParser(tokens).parse()
@@ -4,16 +4,20 @@ from tokenizer import *
 from errors import *
 
 
-def test_empty():
-    tokenizer = AssemblerTokenizer()
+@pytest.fixture(scope="module")
+def tokenizer():
+    """Tokenizer shared by the tests of this module, it keeps no state"""
+    return AssemblerTokenizer()
+
+
+def test_empty(tokenizer):
     code = ""
     expected = []
     tokens = tokenizer.tokenize(code)
     assert tokens == expected
 
 
-def test_simple_code():
-    tokenizer = AssemblerTokenizer()
+def test_simple_code(tokenizer):
     code = textwrap.dedent(
         """\
         .start:\r
@@ -38,8 +42,7 @@ def test_simple_code():
     assert tokens == expected
 
 
-def test_labels_and_numbers():
-    tokenizer = AssemblerTokenizer()
+def test_labels_and_numbers(tokenizer):
     code = ".start 123 -0x1F 0b101"
 
     expected = [
@@ -52,8 +55,26 @@ def test_labels_and_numbers():
     assert tokens == expected
 
 
-def test_unexpected_char():
-    tokenizer = AssemblerTokenizer()
+def test_windows_and_old_mac_newlines(tokenizer):
+    code = "NOP ; comment\r\nNOP\rNOP"
+
+    expected = [
+        Token(type="MNEMONIC", value="NOP", line=1, start_column=1),
+        Token(type="MNEMONIC", value="NOP", line=2, start_column=1),
+        Token(type="MNEMONIC", value="NOP", line=3, start_column=1),
+    ]
+    tokens = tokenizer.tokenize(code)
+    assert tokens == expected
+
+
+def test_int_values(tokenizer):
+    code = "MOV R5, 123 -0x1F 0b101 .start"
+
+    tokens = tokenizer.tokenize(code)
+    assert [token.int_value for token in tokens] == [None, 5, 123, -31, 5, None]
+
+
+def test_unexpected_char(tokenizer):
     code = "MOV R1, @"
 
     with pytest.raises(UnexpectedCharError) as exc_info:
@@ -61,3 +82,12 @@ def test_unexpected_char():
     assert "Unexpected char '@'" in str(exc_info.value)
     assert exc_info.value.line == 1
     assert exc_info.value.column == 9
+
+
+def test_tokens_are_immutable_and_hashable(tokenizer):
+    token = tokenizer.tokenize("R1")[0]
+
+    with pytest.raises(AttributeError):
+        token.value = "R2"
+    expected = Token(type="REGISTER", value="R1", line=1, start_column=1)
+    assert hash(token) == hash(expected)
@@ -5,6 +5,7 @@ from unittest.mock import patch, mock_open
 from validator import AssemblerValidator
 from errors import *
 from tokenizer import make_tokens, make_token
+from parser import AssemblerParser, make_instruction
 from load_instructions import InstructionLoader
 from load_instructions_test import MOCK_INSTRUCTIONS
 
@@ -89,30 +90,57 @@ def test_validate_address_operand_out_of_range(validator):
 
 def test_validate_instruction_valid(validator):
     """Test validating valid instruction"""
-    instruction = {
-        "mnemonic": "TEST1",
-        "arguments": make_tokens([("DEC", "50"), ("REGISTER", "R2")]),
-        "line": 1,
-        "column": 1,
-    }
+    instruction = make_instruction(
+        "TEST1", make_tokens([("DEC", "50"), ("REGISTER", "R2")]), 1, 1
+    )
+    validator.validate_instruction(instruction)
+
+
+def test_validate_instruction_lowercase_mnemonic(validator):
+    """Test that mnemonics are matched case-insensitively, checks reused per mnemonic"""
+    tokens = make_tokens(
+        [
+            ("MNEMONIC", "test1", 1, 1),
+            ("DEC", "50", 1, 7),
+            ("REGISTER", "R2", 1, 11),
+            ("MNEMONIC", "Test1", 2, 1),
+            ("DEC", "50", 2, 7),
+            ("REGISTER", "R2", 2, 11),
+        ]
+    )
+    validator.validate(AssemblerParser(tokens).parse())
+
+    assert list(validator._operand_checks) == ["TEST1"]
+
+
+def test_operand_checks_shared_between_validators():
+    """Test that validators on the same instruction table reuse resolved checks"""
+    instructions = {item["mnemonic"]: item for item in MOCK_INSTRUCTIONS}
+    instruction = make_instruction(
+        "TEST1", make_tokens([("DEC", "50"), ("REGISTER", "R2")]), 1, 1
+    )
+    with patch.object(
+        InstructionLoader, "load_instructions", return_value=instructions
+    ):
+        AssemblerValidator().validate_instruction(instruction)
+        validator = AssemblerValidator()
+
+    assert "TEST1" in validator._operand_checks
     validator.validate_instruction(instruction)
 
 
 def test_validate_instruction_invalid_mnemonic(validator):
     """Test validating invalid instruction mnemonic"""
-    instruction = {"mnemonic": "INVALID", "arguments": [], "line": 1, "column": 1}
+    instruction = make_instruction("INVALID", [], 1, 1)
     with pytest.raises(InvalidInstructionError, match="Invalid instruction"):
         validator.validate_instruction(instruction)
 
 
 def test_validate_instruction_wrong_operand_count(validator):
     """Test validating instruction with wrong number of operands"""
-    instruction = {
-        "mnemonic": "TEST1",
-        "arguments": [make_token("DEC", "50")],  # Missing second operand
-        "line": 1,
-        "column": 1,
-    }
+    instruction = make_instruction(
+        "TEST1", [make_token("DEC", "50")], 1, 1  # Missing second operand
+    )
     with pytest.raises(InvalidSyntaxError, match="Wrong number of operands"):
         validator.validate_instruction(instruction)
 
@@ -120,13 +148,9 @@ def test_validate_instruction_wrong_operand_count(validator):
 def test_validate_program_valid(validator):
     """Test validating valid program"""
     program = [
-        {
-            "type": "instruction",
-            "mnemonic": "TEST1",
-            "arguments": make_tokens([("DEC", "50"), ("REGISTER", "R2")]),
-            "line": 1,
-            "column": 1,
-        }
+        make_instruction(
+            "TEST1", make_tokens([("DEC", "50"), ("REGISTER", "R2")]), 1, 1
+        )
     ]
     validator.validate(program)
 
@@ -134,16 +158,74 @@ def test_validate_program_valid(validator):
 def test_validate_program_invalid(validator):
     """Test validating invalid program"""
     program = [
-        {
-            "type": "instruction",
-            "mnemonic": "TEST1",
-            "arguments": make_tokens(
-                [("DEC", "150"), ("REGISTER", "R2")]  # Out of range
-            ),
-            "line": 1,
-            "column": 1,
-        }
+        make_instruction(
+            "TEST1",
+            make_tokens([("DEC", "150"), ("REGISTER", "R2")]),  # Out of range
+            1,
+            1,
+        )
     ]
     with pytest.raises(ValueOutOfRangeError):
         validator.validate(program)
         validator.validate(program)
+
+
+def test_validate_cached_skips_already_valid_source(validator):
+    """Test that a source is only validated until it passes once"""
+    program = [
+        make_instruction(
+            "TEST1", make_tokens([("DEC", "50"), ("REGISTER", "R2")]), 1, 1
+        )
+    ]
+    with patch.object(validator, "validate", wraps=validator.validate) as validate:
+        validator.validate_cached(program, "TEST1 50, R2")
+        validator.validate_cached(program, "TEST1 50, R2")
+
+    assert validate.call_count == 1
+
+
+def test_validate_cached_keeps_last_sources(validator):
+    """Test that only the most recent valid sources are remembered"""
+    program = [
+        make_instruction(
+            "TEST1", make_tokens([("DEC", "50"), ("REGISTER", "R2")]), 1, 1
+        )
+    ]
+    with patch.object(AssemblerValidator, "MAX_VALIDATED_SOURCES", 2):
+        for source in ("a", "b", "c"):
+            validator.validate_cached(program, source)
+        with patch.object(validator, "validate") as validate:
+            validator.validate_cached(program, "c")
+            validator.validate_cached(program, "a")
+
+    assert len(validator._validated_sources) == 2
+    assert validate.call_count == 1
+
+
+def test_validate_cached_evicts_least_recently_used(validator):
+    """Test that a source used again outlives sources added after it"""
+    program = [
+        make_instruction(
+            "TEST1", make_tokens([("DEC", "50"), ("REGISTER", "R2")]), 1, 1
+        )
+    ]
+    with patch.object(AssemblerValidator, "MAX_VALIDATED_SOURCES", 2):
+        for source in ("a", "b", "a", "c"):
+            validator.validate_cached(program, source)
+        with patch.object(validator, "validate") as validate:
+            validator.validate_cached(program, "a")
+            validator.validate_cached(program, "b")
+
+    assert validate.call_count == 1
+
+
+def test_validate_cached_does_not_cache_invalid_source(validator):
+    """Test that an invalid source is validated again every time"""
+    program = [
+        make_instruction(
+            "TEST1", make_tokens([("DEC", "150"), ("REGISTER", "R2")]), 1, 1
+        )
+    ]
+    for _ in range(2):
+        with pytest.raises(ValueOutOfRangeError):
+            validator.validate_cached(program, "TEST1 150, R2")
@@ -1,7 +1,9 @@
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import partial
 
-from constants import AssemblerConstants
+from constants import TOKEN_SPECIFICATION
 from errors import UnexpectedCharError
 
 
@@ -14,34 +16,52 @@ class Token:
         value: The actual text value of the token.
         line: Line number where the token appears (1-indexed).
         start_column: Starting column position of the token (1-indexed).
+        int_value: Register index or number the token stands for, parsed once
+            when tokenizing; None for other tokens.
     """
 
     type: str
     value: str
     line: int
     start_column: int
+    int_value: int | None = field(default=None, compare=False)
 
 
 def make_token(token_type: str, value: str, line: int = 1, column: int = 1) -> Token:
-    return Token(type=token_type, value=value, line=line, start_column=column)
+    return Token(token_type, value, line, column)
 
 
 def make_tokens(to_build: list[tuple]) -> list[Token]:
     """Helper to build tokens list:
     make_tokens(("MNEMONIC", "MOV", 1, 1), ("REGISTER", "R1", 1, 5))
     """
-    return [make_token(*spec) for spec in to_build]
+    # Full (type, value, line, column) specs map straight onto Token
+    return [
+        Token(*spec) if len(spec) == 4 else make_token(*spec) for spec in to_build
+    ]
+
+
+# Compiled once for all tokenizers; token kinds are the named groups
+_TOKEN_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPECIFICATION)
+)
+# Token type by group index; interned like the type literals compared against
+# downstream, so those comparisons succeed on identity
+_TOKEN_TYPES = (None,) + tuple(sys.intern(name) for name, _ in TOKEN_SPECIFICATION)
+# Parsers of the integer value of register and number tokens
+_INT_VALUE_PARSERS = {
+    "REGISTER": lambda value: int(value[1:]),
+    "HEX": partial(int, base=0),
+    "BIN": partial(int, base=0),
+    "DEC": partial(int, base=0),
+}
 
 
 class AssemblerTokenizer:
     """Converts assembly code into tokens using regular expression patterns."""
 
     def __init__(self):
-        self.token_pattern = re.compile(
-            "|".join(
-                f"(?P<{name}>{pattern})" for name, pattern in AssemblerConstants.TOKEN_SPECIFICATION
-            )
-        )
+        self.token_pattern = _TOKEN_PATTERN
 
     def tokenize(self, code: str) -> list[Token]:
         """Converts a string of assembly code into a list of tokens.
@@ -55,18 +75,16 @@ class AssemblerTokenizer:
         Raises:
             UnexpectedCharError: If an unrecognized character is encountered.
         """
-        # Normalize Windows newlines to '\n' for consistent line/column accounting.
-        code = code.replace("\r\n", "\n").replace("\r", "\n")
-
         tokens: list[Token] = []
+        token_types = _TOKEN_TYPES
+        int_value_parsers = _INT_VALUE_PARSERS
         line_num = 1
         line_start = 0  # tracks start index of current line
 
         for match in self.token_pattern.finditer(code):
-            token_type: str = match.lastgroup
-            value: str = match.group()
-            column = match.start() - line_start + 1
+            token_type: str = token_types[match.lastindex]
 
+            # Text and column are only read for matches that are kept
             match token_type:
                 case "NEWLINE":
                     line_num += 1
@@ -75,16 +93,26 @@ class AssemblerTokenizer:
                     continue
                 case "MISMATCH":
                     raise UnexpectedCharError(
-                        f"Unexpected char {value!r}", line_num, column
+                        f"Unexpected char {match.group()!r}",
+                        line_num,
+                        match.start() - line_start + 1,
                     )
                 case _:
+                    value: str = match.group()
+                    column = match.start() - line_start + 1
+                    int_value = None
+                    if token_type == "IDENT" or token_type == "MNEMONIC":
+                        # Interned so symbol and instruction table lookups can
+                        # match by identity.
+                        value = sys.intern(value)
+                    elif (parse_int := int_value_parsers.get(token_type)) is not None:
+                        try:
+                            int_value = parse_int(value)
+                        except ValueError:
+                            # Left unparsed, reading the operand reports it later
+                            pass
                     tokens.append(
-                        Token(
-                            type=token_type,
-                            value=value,
-                            line=line_num,
-                            start_column=column,
-                        )
+                        Token(token_type, value, line_num, column, int_value)
                     )
 
         return tokens
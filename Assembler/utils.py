@@ -1,13 +1,18 @@
 from tokenizer import Token
-from typing import Sequence
+
+# Built once, the checks below run for every operand
+_NUMBER_TYPES = frozenset({"HEX", "BIN", "DEC"})
+_ADDRESS_TYPES = _NUMBER_TYPES | {"IDENT"}
 
 
 def get_register_number(token: Token) -> int:
-    return int(token.value[1:])
+    number = token.int_value
+    return int(token.value[1:]) if number is None else number
 
 
 def get_number(token: Token) -> int:
-    return int(token.value, 0)
+    number = token.int_value
+    return int(token.value, 0) if number is None else number
 
 
 def is_register(token: Token) -> bool:
@@ -15,13 +20,8 @@ def is_register(token: Token) -> bool:
 
 
 def is_number(token: Token) -> bool:
-    return token.type in frozenset({"HEX", "BIN", "DEC"})
+    return token.type in _NUMBER_TYPES
 
 
 def is_address(token: Token) -> bool:
-    return token.type in frozenset({"IDENT", "HEX", "BIN", "DEC"})
-
-
-def is_in_range(number: int, range_list: Sequence[int]) -> bool:
-    lower, upper = range_list
-    return lower <= number <= upper
+    return token.type in _ADDRESS_TYPES
@@ -11,27 +11,85 @@ from utils import (
     is_register,
     is_number,
     is_address,
-    is_in_range,
     get_register_number,
     get_number,
 )
 from load_instructions import InstructionLoader
-from constants import AssemblerConstants
+from parser import Instruction, Statement
+from constants import ADDRESS_RANGE, REGISTER_RANGE
+from functools import partial
+from hashlib import blake2b
+from typing import Callable, Mapping
+
+# Bounds unpacked once, the operand checks compare against them directly
+_MIN_REGISTER, _MAX_REGISTER = REGISTER_RANGE
+_MIN_ADDRESS, _MAX_ADDRESS = ADDRESS_RANGE
+
+# Checks a single operand token, raising if it does not fit its specification
+OperandCheck = Callable[[Token], None]
+# Checks of the operands of an instruction, in operand order
+OperandChecks = tuple[OperandCheck, ...]
 
 
 class AssemblerValidator:
     """Validates assembly instructions against a specification file."""
 
+    MAX_VALIDATED_SOURCES = 64
+
+    # Operand checks and validated sources for the most recently loaded instruction
+    # table, shared by validators
+    _shared_cache: (
+        tuple[Mapping[str, dict], dict[str, OperandChecks], dict[bytes, None]] | None
+    ) = None
+
     def __init__(self):
         self.instructions = InstructionLoader.load_instructions()
+        # _operand_checks holds the operand checks by mnemonic, _validated_sources
+        # the digests of source code whose program already passed validation
+        self._operand_checks, self._validated_sources = self._shared_caches(
+            self.instructions
+        )
+
+    @classmethod
+    def _shared_caches(
+        cls, instructions: Mapping[str, dict]
+    ) -> tuple[dict[str, OperandChecks], dict[bytes, None]]:
+        """Return the operand check and validated source caches for a table.
+
+        Both only depend on the instruction specifications, so validators built on
+        the same (cached) table reuse what earlier ones resolved.
+        """
+        cache = cls._shared_cache
+        if cache is None or cache[0] is not instructions:
+            cache = cls._shared_cache = (instructions, {}, {})
+        return cache[1], cache[2]
 
-    def validate(self, program: list[dict]):
+    def validate(self, program: list[Statement]):
         """Validates a complete parsed program."""
         for line in program:
-            if line["type"] == "instruction":
+            if isinstance(line, Instruction):
                 self.validate_instruction(line)
 
-    def validate_instruction(self, instruction: dict):
+    def validate_cached(self, program: list[Statement], source: str):
+        """Validates a program parsed from source, unless that source passed before.
+
+        Used by the emulator, which reloads the same program repeatedly. Parsing
+        is deterministic, so a program parsed from source code that was already
+        validated is valid too; digests of the MAX_VALIDATED_SOURCES most recently
+        used valid sources are kept.
+        """
+        digest = blake2b(source.encode(), digest_size=16).digest()
+        validated_sources = self._validated_sources
+        if digest in validated_sources:
+            # Moved to the end, so the dict stays ordered from least recently used
+            validated_sources[digest] = validated_sources.pop(digest)
+            return
+        self.validate(program)
+        validated_sources[digest] = None
+        if len(validated_sources) > self.MAX_VALIDATED_SOURCES:
+            del validated_sources[next(iter(validated_sources))]
+
+    def validate_instruction(self, instruction: Instruction):
         """
         Validate a single instruction against the instruction specification.
 
@@ -41,36 +99,66 @@ class AssemblerValidator:
         - Each operand matches its expected type and constraints
 
         Args:
-            instruction: Dictionary returned by parser
+            instruction: Instruction record returned by parser
 
         Raises:
             InvalidInstructionError: If mnemonic is not recognized
             InvalidSyntaxError: If operand count doesn't match specification
         """
-        mnemonic = instruction["mnemonic"].upper()
-
-        if mnemonic not in self.instructions:
-            raise InvalidInstructionError(
-                f"Invalid instruction: {mnemonic}",
-                line=instruction["line"],
-                column=instruction["column"],
-            )
-
-        instruction_spec = self.instructions[mnemonic]
-        expected_operands = instruction_spec.get("operands", [])
+        operand_checks = self._operand_checks.get(instruction.mnemonic)
+        if operand_checks is None:
+            operand_checks = self._compile_operand_checks(instruction)
 
         # Check operand count matches
-        if len(instruction["arguments"]) != len(expected_operands):
+        arguments = instruction.arguments
+        if len(arguments) != len(operand_checks):
             raise InvalidSyntaxError(
-                f"Wrong number of operands for {mnemonic}. "
-                f"Expected {len(expected_operands)}, got {len(instruction['arguments'])}",
-                line=instruction["line"],
-                column=instruction["column"],
+                f"Wrong number of operands for {instruction.mnemonic}. "
+                f"Expected {len(operand_checks)}, got {len(arguments)}",
+                line=instruction.line,
+                column=instruction.column,
             )
 
         # Validate each operand against its specification
-        for operand, operand_spec in zip(instruction["arguments"], expected_operands):
-            self.validate_operand(operand, operand_spec)
+        for operand, check in zip(arguments, operand_checks):
+            check(operand)
+
+    def _compile_operand_checks(self, instruction: Instruction) -> OperandChecks:
+        """Resolve the operand checks for the mnemonic of an instruction.
+
+        The specification lookup and the dispatch on operand types are done once
+        per mnemonic; the result is cached for later instructions.
+
+        Raises:
+            InvalidInstructionError: If mnemonic is not recognized
+        """
+        mnemonic = instruction.mnemonic
+        instruction_spec = self.instructions.get(mnemonic)
+        if instruction_spec is None:
+            raise InvalidInstructionError(
+                f"Invalid instruction: {mnemonic}",
+                line=instruction.line,
+                column=instruction.column,
+            )
+
+        operand_checks = []
+        for operand_spec in instruction_spec.get("operands", []):
+            match operand_spec["type"]:
+                case "reg":
+                    check = self._validate_register_operand
+                case "num":
+                    check = partial(
+                        self._validate_number_in_range, *operand_spec["range"]
+                    )
+                case "adr":
+                    check = self._validate_address_operand
+                case _:
+                    # validate_operand reports the unknown type when it is reached
+                    check = partial(self.validate_operand, operand_spec=operand_spec)
+            operand_checks.append(check)
+
+        operand_checks = self._operand_checks[mnemonic] = tuple(operand_checks)
+        return operand_checks
 
     def validate_operand(self, operand: Token, operand_spec: dict):
         """
@@ -110,8 +198,7 @@ class AssemblerValidator:
             )
 
         reg_num = get_register_number(operand)
-        min_reg, max_reg = AssemblerConstants.REGISTER_RANGE
-        if not (min_reg <= reg_num <= max_reg):
+        if not (_MIN_REGISTER <= reg_num <= _MAX_REGISTER):
             raise InvalidRegisterError(
                 f"Invalid register number {reg_num}. Must be between 0 and 7",
                 line=operand.line,
@@ -121,6 +208,15 @@ class AssemblerValidator:
     @staticmethod
     def _validate_number_operand(operand: Token, operand_spec: dict) -> None:
         """Validate number operand against its specification."""
+        lower, upper = operand_spec["range"]
+        AssemblerValidator._validate_number_in_range(lower, upper, operand)
+
+    @staticmethod
+    def _validate_number_in_range(lower: int, upper: int, operand: Token) -> None:
+        """Validate number operand against the range lower to upper, inclusive.
+
+        The bounds come first so they can be bound once per operand specification.
+        """
         if not is_number(operand):
             raise InvalidOperandError(
                 f"Expected numeric operand, got {operand.type}",
@@ -129,14 +225,9 @@ class AssemblerValidator:
             )
 
         number = get_number(operand)
-        if not is_in_range(number, operand_spec["range"]):
-            range_desc = (
-                f"{operand_spec['range'][0]} to {operand_spec['range'][1]}"
-                if operand_spec["range"]
-                else "any value"
-            )
+        if not (lower <= number <= upper):
             raise ValueOutOfRangeError(
-                f"Value {number} is out of range. Expected {range_desc}",
+                f"Value {number} is out of range. Expected {lower} to {upper}",
                 line=operand.line,
                 column=operand.start_column,
             )
@@ -153,8 +244,7 @@ class AssemblerValidator:
 
         if is_number(operand):
             number = get_number(operand)
-            min_addr, max_addr = AssemblerConstants.ADDRESS_RANGE
-            if not (min_addr <= number <= max_addr):
+            if not (_MIN_ADDRESS <= number <= _MAX_ADDRESS):
                 raise InvalidAddressError(
                     f"Invalid address. Must be between 0 and 1023",
                     line=operand.line,
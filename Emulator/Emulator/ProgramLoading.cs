@@ -148,8 +148,9 @@ namespace Emulator
                     using (var parsedProgram = parserInstance.InvokeMethod("parse"))
                     using (var validatorInstance = validator.InvokeMethod("AssemblerValidator"))
                     {
-                        validatorInstance.InvokeMethod("validate", parsedProgram);
-                        return ConvertPythonListOfDicts(parsedProgram);
+                        // Reloading unchanged code skips validation
+                        validatorInstance.InvokeMethod("validate_cached", parsedProgram, assemblyCode.ToPython());
+                        return ConvertPythonStatements(parsedProgram);
                     }
                 }
             }
@@ -164,29 +165,29 @@ namespace Emulator
         }
 
         /// <summary>
-        /// Converts a dynamic Python list of dictionaries into a strongly-typed list of <see cref="ProgramStatement"/>.
+        /// Converts a dynamic Python list of parsed statements into a strongly-typed list of <see cref="ProgramStatement"/>.
         /// </summary>
-        /// <remarks>This method processes each dictionary in the input list based on its "type" property.
+        /// <remarks>This method processes each statement record in the input list based on its "type" attribute.
         /// If the type is "label", creates a <see cref="LabelStatement"/>. 
         /// If "instruction", creates an <see cref="InstructionStatement"/> with converted <see cref="Token"/> arguments.</remarks>
         /// <remarks>This method runs after code is already validated by Python validator, so it omits some checks.</remarks>
-        /// <param name="pythonList">A dynamic list of dictionaries, where each dictionary represents a program statement with properties such as
-        /// type, label, mnemonic, and arguments.</param>
+        /// <param name="pythonList">A dynamic list of Python <c>Label</c> and <c>Instruction</c> records, each representing a program statement with
+        /// attributes such as type, label, mnemonic, and arguments.</param>
         /// <returns>A list of <see cref="ProgramStatement"/> objects representing the converted program statements.</returns>
-        private static List<ProgramStatement> ConvertPythonListOfDicts(dynamic pythonList)
+        private static List<ProgramStatement> ConvertPythonStatements(dynamic pythonList)
         {
             var result = new List<ProgramStatement>();
 
             foreach (dynamic item in pythonList)
             {
-                string type = item["type"].ToString();
+                string type = item.type.ToString();
 
                 if (type == "label")
                 {
                     var labelStmt = new LabelStatement(
-                        item["label"].ToString(),
-                        int.Parse(item["line"].ToString()),
-                        int.Parse(item["column"].ToString())
+                        item.label.ToString(),
+                        int.Parse(item.line.ToString()),
+                        int.Parse(item.column.ToString())
                     );
                     result.Add(labelStmt);
                 }
@@ -194,7 +195,7 @@ namespace Emulator
                 {
                     // Convert arguments (list of tokens)
                     List<Token> arguments = new();
-                    foreach (dynamic arg in item["arguments"])
+                    foreach (dynamic arg in item.arguments)
                     {
                         var token = new Token(
                             arg.type.ToString(),
@@ -206,10 +207,10 @@ namespace Emulator
                     }
 
                     var instructionStmt = new InstructionStatement(
-                        item["mnemonic"].ToString(),
+                        item.mnemonic.ToString(),
                         arguments,
-                        int.Parse(item["line"].ToString()),
-                        int.Parse(item["column"].ToString())
+                        int.Parse(item.line.ToString()),
+                        int.Parse(item.column.ToString())
                     );
 
                     result.Add(instructionStmt);